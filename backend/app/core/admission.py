@@ -0,0 +1,186 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def executor_workers() -> int:
+    """asyncio 기본 executor(asyncio.to_thread)의 작업 스레드 수"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class OverloadedError(Exception):
+    """대기열이 가득 차 요청을 받을 수 없을 때 발생하는 예외"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"QA system is overloaded, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """QA 요청(LLM 호출)의 동시 실행 수를 제한하는 적응형 승인 제어기
+
+    - 동시 실행 한도는 응답 지연 시간 기반 AIMD 로 조정한다
+      (한도가 실제로 찼을 때 목표 지연 이내면 한도를 조금씩 늘리고, 초과하거나 실패하면 비율로 줄인다)
+    - 한도를 넘는 요청은 우선순위 대기열(숫자가 작을수록 우선)에서 max_wait 초까지 기다린다
+    - 대기 시간이 초과되거나 대기열에서 밀려난 요청은 검색 결과만 반환하는 축소 모드로 처리한다
+    - 대기열과 축소 모드 처리량이 모두 가득 차면 OverloadedError 로 즉시 거절한다
+    """
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 target_latency: float = 15.0, max_queue: int = 16, max_wait: float = 10.0,
+                 max_degraded: int = 16, backoff: float = 0.7):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(f"Invalid concurrency limits: min_limit={min_limit}, "
+                             f"initial_limit={initial_limit}, max_limit={max_limit}")
+        if max_queue < 0 or max_degraded < 0:
+            raise ValueError(f"max_queue and max_degraded must be >= 0 (got {max_queue}, {max_degraded})")
+        if not 0 < backoff < 1:
+            raise ValueError(f"backoff must be between 0 and 1 (got {backoff})")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.max_degraded = max_degraded
+        self.backoff = backoff
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._degraded = 0
+        self._avg_latency = target_latency
+        self._queue: List[tuple] = []
+        self._counter = itertools.count()
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def retry_after(self) -> int:
+        """현재 대기열이 비워질 때까지의 예상 시간 (초)"""
+        waves = (len(self._queue) + self._in_flight) / self.limit
+        return max(1, math.ceil(self._avg_latency * waves))
+
+    async def acquire(self, priority: int = 1) -> bool:
+        """LLM 실행 슬롯 요청
+
+        슬롯을 얻으면 True, 축소 모드로 처리해야 하면 False 를 반환한다.
+        """
+        if self._in_flight < self.limit and not self._queue:
+            self._in_flight += 1
+            return True
+
+        if len(self._queue) >= self.max_queue and not self._evict_for(priority):
+            return self._degrade_or_reject()
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._counter), future)
+        heapq.heappush(self._queue, entry)
+        try:
+            granted = await asyncio.wait_for(asyncio.shield(future), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            if future.done():
+                granted = future.result()
+            else:
+                future.cancel()
+                self._remove(entry)
+                granted = False
+        except asyncio.CancelledError:
+            if future.done() and future.result():
+                self._release_slot()
+            else:
+                future.cancel()
+                self._remove(entry)
+            raise
+
+        if not granted:
+            return self._degrade_or_reject()
+        return True
+
+    def release(self, latency: float, success: bool = True):
+        """LLM 실행 슬롯 반환 및 지연 시간 기반 한도 조정
+
+        한도는 실행 슬롯이 모두 찼거나 대기 요청이 있을 때만 늘린다. 한도에
+        못 미치는 부하에서 늘리면 한가한 시간 뒤 몰려온 요청이 max_limit 만큼
+        한꺼번에 통과한다.
+        """
+        self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+        if success and latency <= self.target_latency:
+            if self._in_flight >= self.limit or self._queue:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+        else:
+            self._limit = max(self.min_limit, self._limit * self.backoff)
+            logger.warning(f"Reducing QA concurrency limit to {self.limit} "
+                           f"(latency={latency:.1f}s, success={success})")
+        self._release_slot()
+
+    def release_degraded(self):
+        self._degraded -= 1
+
+    @asynccontextmanager
+    async def admit(self, priority: int = 1) -> AsyncIterator[bool]:
+        """승인 제어 컨텍스트 (True: LLM 답변 생성, False: 축소 모드)"""
+        full = await self.acquire(priority)
+        if not full:
+            try:
+                yield False
+            finally:
+                self.release_degraded()
+            return
+
+        started = time.monotonic()
+        success = False
+        try:
+            yield True
+            success = True
+        finally:
+            self.release(time.monotonic() - started, success)
+
+    def _release_slot(self):
+        self._in_flight -= 1
+        while self._queue and self._in_flight < self.limit:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(True)
+
+    def _evict_for(self, priority: int) -> bool:
+        """대기열이 가득 찼을 때 더 낮은 우선순위의 대기 요청을 축소 모드로 밀어내기"""
+        if not self._queue:
+            # max_queue=0 (대기열 없음) 이면 밀어낼 대상이 없다
+            return False
+        worst = max(self._queue)
+        if worst[0] <= priority:
+            return False
+        self._remove(worst)
+        worst[2].set_result(False)
+        return True
+
+    def _remove(self, entry: tuple):
+        try:
+            self._queue.remove(entry)
+        except ValueError:
+            return
+        heapq.heapify(self._queue)
+
+    def _degrade_or_reject(self) -> bool:
+        if self._degraded >= self.max_degraded:
+            raise OverloadedError(self.retry_after())
+        self._degraded += 1
+        return False
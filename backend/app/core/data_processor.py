@@ -6,7 +6,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class DoctorProfile:
     """의사 프로필 정보를 담는 데이터 클래스"""
     id: int
@@ -0,0 +1,281 @@
+from dataclasses import fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+import logging
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .data_processor import DoctorProfile
+
+logger = logging.getLogger(__name__)
+
+# 반복되는 짧은 문자열 컬럼 (코드 배열 + 어휘 목록으로 인터닝)
+CATEGORICAL_COLUMNS = {"Hospital", "Hospital.1", "Department", "Main", "Specialty"}
+CATEGORICAL_FIELDS = {"hospital", "department", "main_focus", "specialty"}
+
+# DoctorProfile 필드명 → 원본 컬럼명 후보 (DataProcessor.process_file 과 동일한 매핑)
+# 이름이 같은 필드(treatment_style 등)는 별도 매핑 없이 그대로 조회된다.
+PROFILE_COLUMNS = {
+    "id": ("ID",),
+    "hospital": ("Hospital",),
+    "doctor_name": ("Doctor_Name",),
+    "department": ("Department",),
+    "main_focus": ("Main",),
+    "specialty": ("Specialty",),
+    "paper_count": ("Paper_Count",),
+    "education": ("Education_Parsed",),
+    "experience": ("Experience_Parsed",),
+    "specialty_detail": ("specialty", "specialty_detail"),
+}
+
+_INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _smallest_int_array(values: Sequence[int]) -> np.ndarray:
+    """값 범위에 맞는 가장 작은 정수 타입 배열 생성"""
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int8)
+    low, high = min(values), max(values)
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.asarray(values, dtype=dtype)
+    return np.asarray(values, dtype=np.int64)
+
+
+class ProfileView:
+    """ProfileStore 의 한 행을 가리키는 슬롯 기반 레코드 뷰
+
+    값을 복사하지 않고 조회 시점에 저장소에서 읽어온다. 원본 컬럼명
+    (``view["Doctor_Name"]``)과 DoctorProfile 필드명(``view.doctor_name``)
+    모두로 접근할 수 있다.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ProfileStore", row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, column: str):
+        return self._store.value(self._row, column)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._store.field(self._row, name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def get(self, name: str, default=None):
+        """DoctorProfile 필드명(또는 컬럼명)으로 값 조회 (없으면 default 반환)"""
+        try:
+            return self._store.field(self._row, name)
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict:
+        """원본 컬럼명을 키로 하는 딕셔너리 반환 (API 응답용)"""
+        return {column: self._store.value(self._row, column) for column in self._store.columns}
+
+    def __repr__(self) -> str:
+        return f"ProfileView(row={self._row}, id={self._store.id_at(self._row)})"
+
+
+class ProfileStore:
+    """의사 프로필을 컬럼 단위로 압축 보관하는 인메모리 저장소
+
+    - 숫자 컬럼: 값 범위에 맞춘 numpy 타입 배열 (결측값은 NaN)
+    - 반복 문자열 컬럼(병원, 진료과 등): 인터닝된 어휘 목록 + 코드 배열
+    - 긴 텍스트 컬럼: 하나의 문자열 풀 + 오프셋 배열
+    - ID → 행 번호 딕셔너리로 O(1) 조회
+    """
+
+    def __init__(self, data: Dict[str, list], id_column: str,
+                 categorical_columns: Iterable[str] = CATEGORICAL_COLUMNS,
+                 aliases: Optional[Dict[str, str]] = None):
+        if id_column not in data:
+            raise ValueError(f"ID column '{id_column}' not found in profile data")
+
+        self.columns: List[str] = list(data)
+        self.id_column = id_column
+        self._size = len(data[id_column])
+
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._categorical: Dict[str, tuple] = {}
+        self._text_slot: Dict[str, int] = {}
+        self._aliases: Dict[str, str] = dict(aliases or {})
+
+        categorical_columns = set(categorical_columns)
+        text_columns = []
+        for column, values in data.items():
+            if len(values) != self._size:
+                raise ValueError(f"Column '{column}' has {len(values)} values, expected {self._size}")
+            kind = self._column_kind(values)
+            if kind == "int":
+                self._numeric[column] = _smallest_int_array([int(v) for v in values])
+            elif kind == "float":
+                self._numeric[column] = np.asarray(
+                    [math.nan if v is None else float(v) for v in values], dtype=np.float64
+                )
+            elif column in categorical_columns:
+                self._categorical[column] = self._intern(values)
+            else:
+                self._text_slot[column] = len(text_columns)
+                text_columns.append(values)
+
+        self._build_text_pool(text_columns)
+
+        ids = self._numeric.get(id_column)
+        if ids is None:
+            raise ValueError(f"ID column '{id_column}' must be numeric")
+        self._row_by_id: Dict[int, int] = {int(pid): row for row, pid in enumerate(ids.tolist())}
+        if len(self._row_by_id) != self._size:
+            logger.warning("Duplicate IDs found in profile data; keeping the last row for each ID")
+
+        logger.info(f"Built ProfileStore with {self._size} profiles ({self.memory_usage() / 1024:.1f} KiB)")
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, id_column: str = "ID",
+                       categorical_columns: Iterable[str] = CATEGORICAL_COLUMNS) -> "ProfileStore":
+        """전처리된 DataFrame 으로부터 저장소 생성"""
+        data = {}
+        for column in df.columns:
+            series = df[column]
+            if pd.api.types.is_integer_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+                data[column] = [int(v) for v in series.tolist()]
+            elif pd.api.types.is_float_dtype(series.dtype):
+                data[column] = [None if pd.isna(v) else float(v) for v in series.tolist()]
+            else:
+                data[column] = ["" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v)
+                                for v in series.tolist()]
+
+        aliases = {}
+        for name, candidates in PROFILE_COLUMNS.items():
+            for candidate in candidates:
+                if candidate in data:
+                    aliases[name] = candidate
+                    break
+            else:
+                logger.warning(f"Profile field '{name}' has no source column "
+                               f"(expected one of {', '.join(candidates)}); it will not be available")
+        return cls(data, id_column=id_column, categorical_columns=categorical_columns, aliases=aliases)
+
+    @classmethod
+    def from_profiles(cls, records: List[DoctorProfile],
+                      categorical_columns: Iterable[str] = CATEGORICAL_FIELDS) -> "ProfileStore":
+        """DoctorProfile 리스트로부터 저장소 생성"""
+        data = {field.name: [getattr(record, field.name) for record in records]
+                for field in fields(DoctorProfile)}
+        return cls(data, id_column="id", categorical_columns=categorical_columns)
+
+    @staticmethod
+    def _column_kind(values: Sequence) -> str:
+        """컬럼 값들의 저장 방식 결정 (int / float / str)"""
+        present = [v for v in values if v is not None]
+        if present and all(isinstance(v, (int, np.integer)) for v in present):
+            return "int" if len(present) == len(values) else "float"
+        if present and all(isinstance(v, (int, float, np.integer, np.floating)) for v in present):
+            return "float"
+        if not present and values:
+            return "float"
+        return "str"
+
+    @staticmethod
+    def _intern(values: Sequence[str]) -> tuple:
+        """반복 문자열을 어휘 목록 + 코드 배열로 변환"""
+        vocabulary: List[str] = []
+        codes_by_value: Dict[str, int] = {}
+        codes = []
+        for value in values:
+            value = "" if value is None else str(value)
+            code = codes_by_value.get(value)
+            if code is None:
+                code = len(vocabulary)
+                codes_by_value[value] = code
+                vocabulary.append(sys.intern(value))
+            codes.append(code)
+        dtype = np.uint8 if len(vocabulary) <= 0xFF else np.uint16 if len(vocabulary) <= 0xFFFF else np.uint32
+        return vocabulary, np.asarray(codes, dtype=dtype)
+
+    def _build_text_pool(self, text_columns: List[Sequence[str]]):
+        """긴 텍스트 컬럼들을 하나의 문자열 풀로 합치기"""
+        pieces = []
+        offsets = [0]
+        for values in text_columns:
+            for value in values:
+                value = "" if value is None else str(value)
+                pieces.append(value)
+                offsets.append(offsets[-1] + len(value))
+        self._text_pool = "".join(pieces)
+        self._text_offsets = _smallest_int_array(offsets)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[ProfileView]:
+        return (ProfileView(self, row) for row in range(self._size))
+
+    def __contains__(self, profile_id) -> bool:
+        return profile_id in self._row_by_id
+
+    def get(self, profile_id: int) -> Optional[ProfileView]:
+        """ID 로 프로필 조회 (없으면 None)"""
+        row = self._row_by_id.get(profile_id)
+        return None if row is None else ProfileView(self, row)
+
+    def row(self, row: int) -> ProfileView:
+        """행 번호로 프로필 뷰 반환"""
+        if not 0 <= row < self._size:
+            raise IndexError(row)
+        return ProfileView(self, row)
+
+    def id_at(self, row: int) -> int:
+        return int(self._numeric[self.id_column][row])
+
+    def field(self, row: int, name: str):
+        """DoctorProfile 필드명을 원본 컬럼명으로 변환하여 값 반환"""
+        return self.value(row, self._aliases.get(name, name))
+
+    def value(self, row: int, column: str):
+        """행/컬럼 위치의 값을 파이썬 기본 타입으로 반환"""
+        array = self._numeric.get(column)
+        if array is not None:
+            value = array[row]
+            if array.dtype.kind == "f":
+                return None if math.isnan(value) else float(value)
+            return int(value)
+
+        interned = self._categorical.get(column)
+        if interned is not None:
+            vocabulary, codes = interned
+            return vocabulary[codes[row]]
+
+        slot = self._text_slot.get(column)
+        if slot is not None:
+            index = slot * self._size + row
+            return self._text_pool[self._text_offsets[index]:self._text_offsets[index + 1]]
+
+        raise KeyError(column)
+
+    def filter_any(self, columns: Sequence[str]) -> List[ProfileView]:
+        """지정한 플래그 컬럼 중 하나라도 1 인 프로필 목록 반환"""
+        if not columns:
+            return list(self)
+        mask = np.zeros(self._size, dtype=bool)
+        for column in columns:
+            mask |= self._numeric[column] == 1
+        return [ProfileView(self, int(row)) for row in np.flatnonzero(mask)]
+
+    def memory_usage(self) -> int:
+        """저장소가 점유하는 대략적인 메모리 (bytes)"""
+        total = sys.getsizeof(self._text_pool) + self._text_offsets.nbytes
+        total += sum(array.nbytes for array in self._numeric.values())
+        for vocabulary, codes in self._categorical.values():
+            total += codes.nbytes + sys.getsizeof(vocabulary)
+            total += sum(sys.getsizeof(value) for value in vocabulary)
+        total += sys.getsizeof(self._row_by_id) + sum(sys.getsizeof(k) for k in self._row_by_id)
+        return total
@@ -1,16 +1,29 @@
 import asyncio
 from openai import OpenAI
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
 from .search_engine import SearchEngine
+from .profile_store import ProfileStore
 
 logger = logging.getLogger(__name__)
 
+class QAGenerationError(Exception):
+    """검색 또는 GPT 답변 생성 실패 (answer 에 사용자에게 보여줄 안내 문구를 담는다)"""
+
+    def __init__(self, answer: str):
+        super().__init__(answer)
+        self.answer = answer
+
+# Pinecone 메타데이터에 없어 프로필 저장소에서 보충하는 필드
+SUPPLEMENT_FIELDS = ("uniqueness", "patient_evaluation")
+
 class QASystem:
-    def __init__(self, search_engine: SearchEngine, openai_api_key: str):
+    def __init__(self, search_engine: SearchEngine, openai_api_key: str,
+                 profile_store: Optional[ProfileStore] = None):
         """QA 시스템 초기화"""
         try:
             self.search_engine = search_engine
+            self.profile_store = profile_store
             self.openai_client = OpenAI(api_key=openai_api_key)
             
             # 시스템 프롬프트 정의
@@ -56,8 +69,65 @@ class QASystem:
             logger.error(f"Error initializing QASystem: {e}")
             raise
 
-    async def retrieve_and_answer(self, question: str) -> str:
-        """질문에 대한 답변 생성"""
+    def _lookup_profile(self, result: Dict) -> Dict:
+        """검색 결과 메타데이터에 없는 필드를 프로필 저장소에서 보충
+
+        메타데이터를 기준으로 하고, 같은 ID 의 프로필이 같은 의사(이름 일치)일
+        때만 SUPPLEMENT_FIELDS 를 채운다.
+        """
+        if self.profile_store is None or result.get('id') is None:
+            return result
+        profile = self.profile_store.get(int(result['id']))
+        if profile is None:
+            return result
+        if profile.get('doctor_name') != result.get('doctor_name'):
+            logger.warning(f"Profile {result['id']} mismatch: metadata '{result.get('doctor_name')}' "
+                           f"vs store '{profile.get('doctor_name')}'; skipping merge")
+            return result
+
+        merged = dict(result)
+        for field in SUPPLEMENT_FIELDS:
+            if merged.get(field) is None:
+                merged[field] = profile.get(field)
+        return merged
+
+    def _format_doctor_list(self, profiles: List) -> str:
+        """GPT 답변 없이 검색된 의사 목록만으로 답변 구성 (과부하 시 축소 모드)
+
+        프론트엔드가 교수 리스트를 채울 수 있도록 GPT 답변과 같은
+        [진료 키워드] 형식으로 끝맺는다.
+        """
+        answer = "현재 문의가 많아 상세 답변 대신 질문과 관련된 교수님 목록을 안내해 드립니다.\n\n"
+        for idx, profile in enumerate(profiles, 1):
+            answer += f"""{idx}. **{profile.get('doctor_name')}** 교수님 ({profile.get('hospital')} {profile.get('department')})
+- 주요진료: {profile.get('main_focus')}
+- 전문분야: {profile.get('specialty')}
+
+"""
+        specialties = self._keyword_values(profiles, 'specialty')
+        # Main 값이 없는 프로필(시트에 Main 컬럼 없음)은 Specialty 로 대신한다
+        main_focus = self._keyword_values(profiles, 'main_focus') or specialties
+        answer += f"""[진료 키워드]
+주요 진료분야(Main): {', '.join(main_focus)}
+세부 전문분야(Specialty): {', '.join(specialties)}"""
+        return answer
+
+    @staticmethod
+    def _keyword_values(profiles: List, field: str) -> List[str]:
+        """프로필들의 필드 값을 중복/결측 없이 순서대로 모으기"""
+        values = []
+        for profile in profiles:
+            value = profile.get(field)
+            if value and value != "N/A" and value not in values:
+                values.append(value)
+        return values
+
+    async def retrieve_and_answer(self, question: str, generate: bool = True) -> str:
+        """질문에 대한 답변 생성 (generate=False 이면 검색 결과 목록만 반환)
+
+        검색이나 GPT 호출이 실패하면 QAGenerationError 를 발생시켜 호출 측
+        (승인 제어기)이 실패로 집계할 수 있게 한다.
+        """
         try:
             search_results = await self.search_engine.search(
                 question, 
@@ -68,6 +138,10 @@ class QASystem:
                 logger.warning("No search results found")
                 return "죄송합니다. 해당 질문에 대한 관련 정보를 찾을 수 없습니다."
 
+            profiles = [self._lookup_profile(result) for result in search_results]
+            if not generate:
+                return self._format_doctor_list(profiles)
+
             # Prompt 구성
             prompt = f"""다음과 같은 질문을 받았습니다: '{question}'
 
@@ -75,7 +149,7 @@ class QASystem:
 
 """
             # 검색 결과 포맷팅
-            for idx, result in enumerate(search_results, 1):
+            for idx, result in enumerate(profiles, 1):
                 prompt += f"""[의사 정보 {idx}]
 • 이름: {result.get('doctor_name')}
 • 소속: {result.get('hospital')} {result.get('department')}
@@ -123,8 +197,10 @@ class QASystem:
                 
             except Exception as e:
                 logger.error(f"Error generating GPT response: {e}")
-                return f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}"
+                raise QAGenerationError(f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}") from e
             
+        except QAGenerationError:
+            raise
         except Exception as e:
             logger.error(f"Error in retrieve_and_answer: {e}")
-            return f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
+            raise QAGenerationError(f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}") from e
\ No newline at end of file
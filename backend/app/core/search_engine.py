@@ -1,6 +1,7 @@
 from openai import OpenAI
 from pinecone import Pinecone, ServerlessSpec
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional
+from pathlib import Path
 import asyncio
 import json
 from collections import Counter
@@ -8,10 +9,17 @@ import os
 import logging
 import pickle
 import re
+import numpy as np
 from .data_processor import DoctorProfile
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-ada-002"
+# 임베딩 API 한 번에 보낼 입력 수 (API 상한 2048 보다 작게)
+EMBEDDING_BATCH_SIZE = 100
+# backend 디렉토리 (main.py 의 BASE_DIR 과 동일)
+BASE_DIR = Path(__file__).resolve().parents[2]
+
 class SearchEngine:
     def __init__(self, api_key: str, pinecone_api_key: str, pinecone_env: str):
         """검색 엔진 초기화"""
@@ -36,6 +44,10 @@ class SearchEngine:
                 )
             
             self.index = self.pc.Index(self.index_name)
+            # 추천 질문 → 임베딩 (float32, 검색 시 임베딩 API 호출 생략)
+            self.query_embeddings: Dict[str, np.ndarray] = {}
+            # 첫 사용 시 임베딩을 보관할 추천 질문 목록
+            self.suggested_queries: set = set()
             logger.info("Successfully initialized SearchEngine")
             
         except Exception as e:
@@ -96,8 +108,7 @@ class SearchEngine:
                         "main_focus": record.main_focus,
                         "treatment_style": record.treatment_style,
                         "consultation_style": record.consultation_style,
-                        "keywords": record.keywords,
-                        "profile_text": profile_text
+                        "keywords": record.keywords
                     }
                     
                     # 벡터 업서트
@@ -126,7 +137,7 @@ class SearchEngine:
         try:
             response = await asyncio.to_thread(
                 self.openai_client.embeddings.create,
-                model="text-embedding-ada-002",
+                model=EMBEDDING_MODEL,
                 input=text
             )
             return response.data[0].embedding
@@ -134,10 +145,70 @@ class SearchEngine:
             logger.error(f"Error generating embedding: {e}")
             raise
 
+    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트의 임베딩을 한 번의 API 호출로 생성 (입력 순서대로 반환)"""
+        try:
+            response = await asyncio.to_thread(
+                self.openai_client.embeddings.create,
+                model=EMBEDDING_MODEL,
+                input=texts
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            raise
+
+    async def precompute_query_embeddings(self, queries: List[str], suggested_queries: Iterable[str] = (),
+                                          cache_file: Optional[str | Path] = None):
+        """추천 질문들의 임베딩을 미리 계산하여 보관 (캐시 파일 재사용)
+
+        queries 는 즉시 계산하고, suggested_queries 는 검색에서 처음 사용될 때 보관한다.
+        캐시 파일 이름에 임베딩 모델명을 포함하여 모델이 바뀌면 새로 계산한다.
+        """
+        if cache_file is None:
+            cache_file = BASE_DIR / f"query_embeddings_{EMBEDDING_MODEL}.pkl"
+        try:
+            self.suggested_queries.update(suggested_queries)
+            self.suggested_queries.update(queries)
+
+            if os.path.exists(cache_file):
+                with open(cache_file, 'rb') as f:
+                    cached = pickle.load(f)
+                self.query_embeddings.update({q: np.asarray(cached[q], dtype=np.float32)
+                                              for q in queries if q in cached})
+                logger.info(f"Loaded {len(self.query_embeddings)} cached query embeddings")
+
+            missing = list(dict.fromkeys(q for q in queries if q not in self.query_embeddings))
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+                try:
+                    embeddings = await self.get_embeddings(batch)
+                except Exception as e:
+                    logger.error(f"Error precomputing embeddings for {len(batch)} queries: {e}")
+                    continue
+                for query, embedding in zip(batch, embeddings):
+                    self.query_embeddings[query] = np.asarray(embedding, dtype=np.float32)
+
+            if missing:
+                with open(cache_file, 'wb') as f:
+                    pickle.dump(self.query_embeddings, f)
+
+            logger.info(f"Precomputed embeddings for {len(self.query_embeddings)} suggested queries")
+
+        except Exception as e:
+            logger.error(f"Error precomputing query embeddings: {e}")
+            raise
+
     async def search(self, query: str, top_k: int = 5) -> List[Dict]:
         """의사 프로필 검색 수행"""
         try:
-            query_embedding = await self.get_embedding(query)
+            cached = self.query_embeddings.get(query)
+            if cached is not None:
+                query_embedding = cached.tolist()
+            else:
+                query_embedding = await self.get_embedding(query)
+                if query in self.suggested_queries:
+                    self.query_embeddings[query] = np.asarray(query_embedding, dtype=np.float32)
             
             results = await asyncio.to_thread(
                 self.index.query,
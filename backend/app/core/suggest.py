@@ -0,0 +1,282 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# keywords 컬럼(자유 서술형 문장)에서 용어를 뽑아내기 위한 패턴
+_SENTENCE = re.compile(r"[.\n]")
+_QUOTES = re.compile(r"['\"‘’“”]")
+_TAIL = re.compile(r"\s+(?:주요|가장|핵심|자주|중요|모두|등|같은|관련|함께|반복)")
+_TAIL_PARTICLES = ("이", "가", "은", "는", "을", "를", "과", "와")
+_LEAD = re.compile(r"^.*(?:는|서|특히|또한)\s+")
+_PARTICLE = re.compile(r"\S(?:이|가|을|를|에게|에서|으로|로)\s")
+_BRACKET_TAG = re.compile(r"\[[^\]]*\]")
+_STOPWORDS = {"키워드", "키워드도", "표현", "치료", "수술", "의사", "용어", "또한", "N/A"}
+# 조사/관형형 어미로 끝나는 조각 ('환자들의', '치료도', '수술 잘하는', '신중한')
+_TRAILING_PARTICLE = re.compile(r"(?:들|의|도|은|는|적인|\S{2}한)$")
+# 조사가 아니라 명사의 일부인 끝음절 ('간내담도', '정확도', '강의')
+_NOUN_ENDINGS = (
+    "담도", "식도", "분화도", "정확도", "숙련도", "일치도", "근접도", "만족도", "인지도", "중증도",
+    "난이도", "밀도", "농도", "강도", "빈도", "위험도", "선호도", "강의", "회의", "동의", "주의", "제한",
+)
+# 직함 ('원장', '위암센터장', '폐암 전문의')
+_TITLE_SUFFIXES = ("원장", "센터장", "병원장", "총장", "회장", "과장", "실장", "학장", "전문의")
+
+# 진료 분야가 아닌 평가/태도 키워드 ('잘 보는' 대신 평가 템플릿 사용)
+_ATTRIBUTE_WORDS = (
+    "친절", "설명", "전문성", "신뢰", "꼼꼼", "소통", "상담", "만족", "실력", "태도", "경험",
+    "배려", "공감", "경청", "따뜻", "명의", "성과", "신속", "빠른", "세심", "차분", "편안",
+    "인성", "정확한", "희망", "열정", "책임감", "시스템", "접근성", "체계적",
+)
+# 부정적 평가 키워드 (추천 질문으로 쓰지 않음)
+_NEGATIVE_WORDS = (
+    "부족", "어려움", "어려운", "불친절", "무뚝뚝", "불만", "지연", "불편", "번복", "아쉬",
+    "부정", "짧은", "긴 대기", "대기시간", "예약", "냉랭", "고압적", "권위적",
+)
+
+# 추천 종류별 /api/qa 로 보낼 질문 템플릿
+QUERY_TEMPLATES = {
+    "doctor": "{term} 교수님은 어떤 분이신가요?",
+    "hospital": "{term} 교수님을 추천해주세요",
+    "department": "{term} 교수님을 추천해주세요",
+    "specialty": "{term} 잘 보는 교수님을 추천해주세요",
+    "keyword": "{term} 잘 보는 교수님을 추천해주세요",
+    "attribute": "{term}{josa} 평가받는 교수님을 추천해주세요",
+}
+
+
+def normalize(text: str) -> str:
+    """검색 키 정규화 (공백 제거 + 소문자)"""
+    return "".join(text.split()).lower()
+
+
+def _ro(term: str) -> str:
+    """받침 여부에 따라 '으로' / '로' 선택"""
+    last = term[-1] if term else ""
+    if not "가" <= last <= "힣":
+        return "(으)로"
+    jong = (ord(last) - ord("가")) % 28
+    return "로" if jong in (0, 8) else "으로"  # 받침 없음 또는 ㄹ 받침
+
+
+def format_query(kind: str, term: str) -> str:
+    """추천 종류에 맞는 /api/qa 질문 생성"""
+    return QUERY_TEMPLATES[kind].format(term=term, josa=_ro(term))
+
+
+def classify_keyword(term: str) -> str:
+    """키워드 용어 분류 (keyword: 진료 관련 / attribute: 평가·태도 / negative: 제외 대상)"""
+    if any(word in term for word in _NEGATIVE_WORDS):
+        return "negative"
+    if any(word in term for word in _ATTRIBUTE_WORDS) or term.endswith("함"):
+        return "attribute"
+    # '헌신적', '직설적' (단, '결핵 흔적' 처럼 두 글자 명사는 제외)
+    last = term.rsplit(" ", 1)[-1]
+    if len(last) >= 3 and last.endswith("적"):
+        return "attribute"
+    return "keyword"
+
+
+def clean_term(term: str) -> str:
+    """'[대장항문외과] 대장암' → '대장암', '[뇌종양]' → '뇌종양' (괄호 짝이 맞지 않으면 빈 문자열)"""
+    term = (term or "").strip()
+    if term.startswith("[") and term.endswith("]") and term.count("[") == 1:
+        term = term[1:-1]
+    term = _BRACKET_TAG.sub("", term).strip(" []")
+    if "[" in term or "]" in term or term.count("(") != term.count(")"):
+        return ""
+    return term
+
+
+def split_departments(value: str) -> List[str]:
+    """'[소화기내과, 대장암센터 소화기내과]' 같은 목록 표기를 진료과 목록으로 분리"""
+    value = (value or "").strip()
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    departments = []
+    for part in value.split(","):
+        part = clean_term(part)
+        if part:
+            departments.append(part)
+    return departments
+
+
+def is_fragment(term: str) -> bool:
+    """조사로 끝나는 문장 조각이나 직함이면 True ('점도', '이들', '서울대병원장', '식도암 전문의')"""
+    if term.endswith(_TITLE_SUFFIXES):
+        return True
+    return bool(_TRAILING_PARTICLE.search(term)) and not term.endswith(_NOUN_ENDINGS)
+
+
+def extract_keyword_terms(text: str) -> List[str]:
+    """keywords 서술문에서 쉼표로 나열된 핵심 용어 추출
+
+    예: '로봇 수술, 전립선암, 브라키테라피가 주요 키워드로 나타납니다.'
+        → ['로봇 수술', '전립선암', '브라키테라피']
+    """
+    terms = []
+    for sentence in _SENTENCE.split(text or ""):
+        for piece in sentence.split(","):
+            head = _TAIL.split(piece, maxsplit=1)
+            piece = head[0]
+            if len(head) > 1:
+                # '추적관찰이 가장' → '추적관찰' (단, '치료 성과 등' 처럼 조사가 아닌 음절은 남긴다)
+                last = piece.rsplit(" ", 1)[-1]
+                if len(last) >= 3 and last[-1] in _TAIL_PARTICLES:
+                    piece = piece[:-1]
+            piece = _LEAD.sub("", piece).strip()
+            piece = next((part.strip() for part in _QUOTES.split(piece) if part.strip()), "")
+            if (1 < len(piece) <= 15 and not piece.endswith("다") and piece.count(" ") <= 2
+                    and piece.count("(") == piece.count(")")
+                    and not _PARTICLE.search(piece) and piece not in _STOPWORDS
+                    and "키워드" not in piece and not is_fragment(piece)):
+                terms.append(piece)
+    return terms
+
+
+@dataclass(slots=True)
+class Suggestion:
+    """자동완성 추천 항목"""
+    label: str
+    kind: str
+    query: str
+    weight: int = 1
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[int] = []
+
+
+class SuggestionIndex:
+    """의사명/병원/진료과/전문분야/키워드에 대한 접두사 트라이 기반 자동완성 인덱스
+
+    각 노드에 가중치 상위 추천 목록을 미리 저장해 두므로 조회 비용은
+    접두사 길이에만 비례한다. 공백으로 구분된 단어의 시작 위치도 함께
+    색인하여 '성모' 로 '강남 성모병원' 을 찾을 수 있다.
+    """
+
+    def __init__(self, suggestions: List[Suggestion], keys: List[List[str]], top_per_node: int = 10):
+        self.suggestions = suggestions
+        self._queries = frozenset(suggestion.query for suggestion in suggestions)
+        self._root = _TrieNode()
+
+        for idx, suggestion_keys in enumerate(keys):
+            for key in suggestion_keys:
+                node = self._root
+                for char in key:
+                    node = node.children.setdefault(char, _TrieNode())
+                    if not node.top or node.top[-1] != idx:
+                        node.top.append(idx)
+
+        rank = lambda idx: (-suggestions[idx].weight, len(suggestions[idx].label))
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            node.top = sorted(set(node.top), key=rank)[:top_per_node]
+            stack.extend(node.children.values())
+
+        logger.info(f"Built SuggestionIndex with {len(suggestions)} suggestions")
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable, top_per_node: int = 10) -> "SuggestionIndex":
+        """DoctorProfile 또는 ProfileView 목록으로부터 인덱스 생성"""
+        terms: Dict[tuple, Dict] = {}
+        entries: List[tuple] = []  # (추천 항목, 색인할 용어)
+
+        def add(kind: str, term: str):
+            term = term.strip() if term else ""
+            if not term or term in _STOPWORDS:
+                return
+            # 같은 질문으로 이어지는 용어(전문분야/키워드의 '폐암' 등)는 하나로 합친다
+            entry = terms.setdefault((QUERY_TEMPLATES[kind], normalize(term)),
+                                     {"kind": kind, "labels": {}, "weight": 0})
+            if kind == "specialty":
+                entry["kind"] = kind
+            entry["labels"][term] = entry["labels"].get(term, 0) + 1
+            entry["weight"] += 1
+
+        profiles = list(profiles)
+        # 키워드에 섞인 병원명('서울성모병원', '빅5 병원')은 병원 추천과 겹치므로 제외
+        hospital_words = {normalize(word).removesuffix("병원")
+                          for profile in profiles for word in (getattr(profile, "hospital", None) or "").split()}
+        hospital_words.discard("")
+
+        def is_hospital(term: str) -> bool:
+            key = normalize(term)
+            return key.endswith("병원") or any(word in key for word in hospital_words)
+
+        doctors: List[tuple] = []  # (후기 수, 추천 항목, 색인할 용어)
+        for profile in profiles:
+            name = getattr(profile, "doctor_name", None)
+            hospital = getattr(profile, "hospital", None)
+            departments = split_departments(getattr(profile, "department", None))
+            if name and name != "N/A":
+                affiliation = " ".join(part for part in (hospital, next(iter(departments), None)) if part)
+                doctors.append((getattr(profile, "total_posts", None) or 0, Suggestion(
+                    label=f"{name} ({affiliation})",
+                    kind="doctor",
+                    query=format_query("doctor", name),
+                ), name))
+            add("hospital", hospital)
+            for department in departments:
+                add("department", department)
+            for term in (getattr(profile, "specialty", None) or "").split(","):
+                add("specialty", clean_term(term))
+            for term in set(extract_keyword_terms(getattr(profile, "keywords", None))):
+                kind = classify_keyword(term)
+                if kind != "negative" and not is_hospital(term):
+                    add(kind, term)
+
+        # 의사는 후기 수가 많은 순서로 두어 임베딩 사전 계산 대상 선정에 사용
+        doctors.sort(key=lambda doctor: -doctor[0])
+        entries.extend((suggestion, name) for _, suggestion, name in doctors)
+
+        for entry in terms.values():
+            label = max(entry["labels"], key=entry["labels"].get)
+            entries.append((Suggestion(
+                label=label,
+                kind=entry["kind"],
+                query=format_query(entry["kind"], label),
+                weight=entry["weight"],
+            ), label))
+
+        keys = []
+        for _, term in entries:
+            words = term.split()
+            keys.append([normalize(" ".join(words[i:])) for i in range(len(words))])
+        return cls([suggestion for suggestion, _ in entries], keys, top_per_node=top_per_node)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Suggestion]:
+        """접두사로 시작하는 추천 항목을 가중치 순으로 반환"""
+        node = self._root
+        for char in normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [self.suggestions[idx] for idx in node.top[:limit]]
+
+    def top_queries(self, n: int, doctor_share: float = 0.25) -> List[str]:
+        """임베딩 사전 계산 대상 질문 n 개
+
+        doctor_share 만큼은 후기 수 상위 의사 질문으로 채우고, 나머지는 가중치 순의
+        진료 관련 질문(병원/진료과/전문분야/키워드)으로 채운다. 평가 키워드는 제외.
+        """
+        doctors = list(dict.fromkeys(s.query for s in self.suggestions if s.kind == "doctor"))
+        others = list(dict.fromkeys(s.query for s in sorted(self.suggestions, key=lambda s: -s.weight)
+                                    if s.kind not in ("doctor", "attribute")))
+        others = others[:n - min(len(doctors), int(n * doctor_share))]
+        return others + doctors[:n - len(others)]
+
+    def is_suggested(self, query: str) -> bool:
+        """자동완성 추천 질문인지 여부"""
+        return query in self._queries
+
+    def queries(self) -> List[str]:
+        """모든 추천 질문 (첫 사용 시 임베딩을 보관할 대상)"""
+        return list(dict.fromkeys(suggestion.query for suggestion in self.suggestions))
@@ -1,4 +1,6 @@
 from fastapi import FastAPI, Query, HTTPException
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import pandas as pd
@@ -7,8 +9,22 @@ import os
 from dotenv import load_dotenv
 import numpy as np
 from medical_qa import MedicalQASystem
+from app.core.profile_store import ProfileStore
+from app.core.admission import AdmissionController, OverloadedError, executor_workers
+from app.core.qa_system import QAGenerationError
+from app.core.suggest import SuggestionIndex
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 상위 추천 질문 임베딩은 서버 기동을 막지 않도록 백그라운드에서 계산
+    top_n = int(os.getenv("SUGGEST_PRECOMPUTE", 200))
+    app.state.precompute_task = asyncio.create_task(
+        qa_system.precompute_query_embeddings(suggestion_index.top_queries(top_n), suggestion_index.queries())
+    )
+    yield
+    app.state.precompute_task.cancel()
+
+app = FastAPI(lifespan=lifespan)
 
 # QA 시스템 초기화
 try:
@@ -37,6 +53,12 @@ class QARequest(BaseModel):
 
 class QAResponse(BaseModel):
     answer: str
+    degraded: bool = False  # True 이면 GPT 답변 없이 의사 목록만 반환된 응답
+
+class Suggestion(BaseModel):
+    label: str
+    kind: str
+    query: str
 
 # 환경변수 로드
 load_dotenv()
@@ -50,10 +72,38 @@ df = pd.read_excel(csv_file_path)
 # 데이터 전처리
 df = df.replace("N/A", None)
 for col in df.columns:
-    if df[col].dtype == object:
-        df[col] = df[col].fillna("N/A")
-    else:
+    # pandas 3 의 문자열 컬럼은 object 가 아닌 str dtype 이므로 숫자 여부로 판단
+    if pd.api.types.is_numeric_dtype(df[col].dtype):
         df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    else:
+        df[col] = df[col].fillna("N/A")
+
+# 타입별 컬럼 배열 + ID 인덱스로 압축 보관 (DataFrame 은 더 이상 유지하지 않음)
+profile_store = ProfileStore.from_dataframe(df)
+qa_system.set_profile_store(profile_store)
+del df
+
+# 자동완성 인덱스 (의사명/병원/진료과/전문분야/키워드)
+suggestion_index = SuggestionIndex.from_profiles(profile_store)
+
+# QA 요청 승인 제어 (LLM 동시 호출 수 제한 + 과부하 시 축소 모드/거절)
+# GPT 호출은 asyncio 기본 executor 에서 실행되므로 동시 실행 한도가 작업 스레드 수를 넘지 않게 하고,
+# 검색(임베딩/Pinecone) 호출을 위해 스레드 하나는 남겨둔다
+max_concurrency = min(int(os.getenv("QA_MAX_CONCURRENCY", 32)), max(1, executor_workers() - 1))
+admission = AdmissionController(
+    initial_limit=min(int(os.getenv("QA_CONCURRENCY", 4)), max_concurrency),
+    max_limit=max_concurrency,
+    target_latency=float(os.getenv("QA_TARGET_LATENCY", 15.0)),
+    max_queue=int(os.getenv("QA_MAX_QUEUE", 16)),
+    max_wait=float(os.getenv("QA_MAX_WAIT", 10.0)),
+)
+
+def qa_priority(question: str) -> int:
+    """승인 대기열 우선순위 (클라이언트가 아닌 서버에서 결정)
+
+    검색창에서 고른 자동완성 추천 질문(0)을 직접 입력한 질문(1)보다 먼저 처리한다.
+    """
+    return 0 if suggestion_index.is_suggested(question) else 1
 
 # API 엔드포인트
 @app.get("/")
@@ -62,16 +112,35 @@ def read_root():
 
 @app.post("/api/qa", response_model=QAResponse)
 async def get_gpt_answer(request: QARequest):
+    full = True
     try:
-        response = await qa_system.ask_question(request.question)
-        return {"answer": response}
+        async with admission.admit(qa_priority(request.question)) as full:
+            response = await qa_system.ask_question(request.question, generate=full)
+        return {"answer": response, "degraded": not full}
+    except QAGenerationError as e:
+        # 승인 제어기에는 실패로 반영되고, 사용자에게는 안내 문구로 응답
+        return {"answer": e.answer, "degraded": not full}
+    except OverloadedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="현재 요청이 많아 답변할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
+@app.get("/api/suggest", response_model=list[Suggestion])
+def get_suggestions(prefix: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=20)):
+    """검색창 자동완성 (선택한 추천의 query 를 그대로 /api/qa 로 보내면 임베딩 호출이 생략됨)"""
+    return [
+        {"label": s.label, "kind": s.kind, "query": s.query}
+        for s in suggestion_index.suggest(prefix, limit)
+    ]
+
 @app.get("/api/professors")
 def get_professors(query: str | None = None):
     try:
-        filtered_data = df
+        filtered_data = list(profile_store)
         
         if query:
             # 디버깅 로그 추가
@@ -92,25 +161,22 @@ def get_professors(query: str | None = None):
                 if cancer_type in query.lower():
                     matched_columns.append(column)
                     # 매칭된 컬럼의 1값을 가진 행 수 출력
-                    matching_rows = len(df[df[column] == 1])
+                    matching_rows = len(profile_store.filter_any([column]))
                     print(f"Found match: {cancer_type} -> {column}")
                     print(f"Number of professors with {column} = 1: {matching_rows}")
             
             if matched_columns:
-                condition = df[matched_columns[0]] == 1
-                for column in matched_columns[1:]:
-                    condition = condition | (df[column] == 1)
-                filtered_data = df[condition]
+                filtered_data = profile_store.filter_any(matched_columns)
                 
                 # 필터링된 결과의 상세 정보 출력
                 print(f"\nFiltered results:")
-                for _, row in filtered_data.iterrows():
+                for row in filtered_data:
                     print(f"Professor: {row['Doctor_Name']}, Hospital: {row['Hospital']}")
                     print(f"Cancer columns: {[col for col in matched_columns if row[col] == 1]}")
             
             print(f"Total matches found: {len(filtered_data)}")
         
-        return filtered_data.to_dict(orient="records")
+        return [row.to_dict() for row in filtered_data]
         
     except Exception as e:
         print(f"Error in get_professors: {str(e)}")
@@ -121,9 +187,11 @@ def get_professors(query: str | None = None):
 def get_professor_by_id(professor_id: int):
     """특정 교수의 상세 정보를 ID를 기반으로 반환"""
     try:
-        professor = df.loc[df['ID'] == professor_id].to_dict(orient="records")
-        if not professor:
+        professor = profile_store.get(professor_id)
+        if professor is None:
             raise HTTPException(status_code=404, detail="교수를 찾을 수 없습니다.")
-        return professor[0]
+        return professor.to_dict()
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
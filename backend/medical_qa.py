@@ -11,11 +11,12 @@ sys.path.append(parent_dir)
 from app.config.aws_config import AWSConfig
 from app.core.data_processor import DataProcessor
 from app.core.search_engine import SearchEngine
-from app.core.qa_system import QASystem
+from app.core.qa_system import QASystem, QAGenerationError
+from app.core.profile_store import ProfileStore
 
 from dotenv import load_dotenv
 import asyncio
-from typing import Dict, List
+from typing import Dict, Iterable, List
 import pandas as pd
 from pathlib import Path
 import logging
@@ -64,6 +65,7 @@ class MedicalQASystem:
                 search_engine=self.search_engine,
                 openai_api_key=os.getenv('OPENAI_API_KEY')
             )
+            self.profile_store = None
             logger.info("Successfully initialized MedicalQASystem")
             
         except ImportError as e:
@@ -95,12 +97,25 @@ class MedicalQASystem:
             
             records = self.data_processor.process_file(local_path)
             logger.info(f"Processed {len(records)} records from S3")
+            self.set_profile_store(ProfileStore.from_profiles(records))
             return records
             
         except Exception as e:
             logger.error(f"Error loading and processing data: {e}")
             raise
 
+    def set_profile_store(self, profile_store: ProfileStore):
+        """답변 생성 시 사용할 프로필 저장소 지정"""
+        self.profile_store = profile_store
+        self.qa_system.profile_store = profile_store
+
+    async def precompute_query_embeddings(self, queries: List[str], suggested_queries: Iterable[str] = ()):
+        """추천 질문 임베딩 사전 계산 (나머지 추천 질문은 첫 사용 시 보관)"""
+        try:
+            await self.search_engine.precompute_query_embeddings(queries, suggested_queries)
+        except Exception as e:
+            logger.error(f"Error precomputing query embeddings: {e}")
+
     async def index_data(self, records: List['MedicalRecord'], use_cache: bool = True):
         """문서 데이터를 Pinecone에 인덱싱"""
         try:
@@ -110,11 +125,13 @@ class MedicalQASystem:
             logger.error(f"Error indexing data: {e}")
             raise
 
-    async def ask_question(self, question: str) -> str:
-        """사용자 질문에 대해 GPT 답변 생성"""
+    async def ask_question(self, question: str, generate: bool = True) -> str:
+        """사용자 질문에 대해 GPT 답변 생성 (generate=False 이면 관련 의사 목록만 반환, 실패 시 QAGenerationError)"""
         try:
-            response = await self.qa_system.retrieve_and_answer(question)
+            response = await self.qa_system.retrieve_and_answer(question, generate=generate)
             return response
+        except QAGenerationError:
+            raise
         except Exception as e:
             logger.error(f"Error generating answer: {e}")
             return "질문에 대한 답변을 처리하지 못했습니다."
@@ -129,7 +146,10 @@ async def main():
 
         # 질문 처리 테스트
         question = "강영남 교수님의 방사선 치료 스타일이 궁금해요. 어떤 분이신가요?"
-        response = await qa_system.ask_question(question)
+        try:
+            response = await qa_system.ask_question(question)
+        except QAGenerationError as e:
+            response = e.answer
         print(response)
         
     except Exception as e:
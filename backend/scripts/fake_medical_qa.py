@@ -0,0 +1,39 @@
+"""부하 테스트용 가짜 medical_qa 모듈
+
+main.py 가 import 하는 MedicalQASystem 을 대신하여, 실제 OpenAI/Pinecone 호출 없이
+검색(짧은 비동기 대기)과 느린 LLM 호출(작업 스레드를 점유하는 blocking sleep)을 흉내낸다.
+"""
+import asyncio
+import random
+import time
+
+from app.core.qa_system import QAGenerationError
+
+# 실행 중 조정 가능한 시뮬레이션 설정
+RETRIEVAL_DELAY = 0.05
+LLM_DELAY = 2.0
+FAILURE_RATE = 0.0
+
+
+class MedicalQASystem:
+    def __init__(self):
+        self.profile_store = None
+        self.llm_calls = 0
+
+    def set_profile_store(self, profile_store):
+        self.profile_store = profile_store
+
+    async def precompute_query_embeddings(self, *args, **kwargs):
+        pass
+
+    async def ask_question(self, question: str, generate: bool = True) -> str:
+        await asyncio.sleep(RETRIEVAL_DELAY)
+        if not generate:
+            return "관련 교수님 목록 (축소 모드)"
+
+        self.llm_calls += 1
+        # OpenAI 클라이언트처럼 asyncio.to_thread 작업 스레드를 점유
+        await asyncio.to_thread(time.sleep, LLM_DELAY)
+        if random.random() < FAILURE_RATE:
+            raise QAGenerationError("죄송합니다. 답변 생성 중 오류가 발생했습니다: fake LLM failure")
+        return f"'{question}' 에 대한 가짜 GPT 답변"
@@ -0,0 +1,88 @@
+"""/api/qa 부하 생성기
+
+가짜 LLM(scripts/fake_medical_qa.py)을 붙인 main.app 에 요청을 몰아넣고
+승인 제어 결과(정상/축소 모드/503)와 지연 시간을 요약한다.
+
+사용 예:
+    python scripts/load_test.py --requests 200 --spread 0 --llm-delay 2
+    python scripts/load_test.py --requests 60 --spread 1 --llm-delay 5 --failure-rate 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+# backend 디렉토리를 Python path 에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test /api/qa against a slow fake LLM")
+    parser.add_argument("--requests", type=int, default=60, help="총 요청 수")
+    parser.add_argument("--spread", type=float, default=1.0, help="요청을 흩뿌릴 시간 (초, 0 이면 동시에)")
+    parser.add_argument("--llm-delay", type=float, default=2.0, help="가짜 LLM 응답 시간 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="가짜 LLM 실패 비율")
+    parser.add_argument("--concurrency", type=int, default=4, help="QA_CONCURRENCY")
+    parser.add_argument("--target-latency", type=float, default=3.0, help="QA_TARGET_LATENCY")
+    parser.add_argument("--max-queue", type=int, default=8, help="QA_MAX_QUEUE")
+    parser.add_argument("--max-wait", type=float, default=2.0, help="QA_MAX_WAIT")
+    return parser.parse_args()
+
+
+async def run(args):
+    os.environ.update(
+        QA_CONCURRENCY=str(args.concurrency),
+        QA_TARGET_LATENCY=str(args.target_latency),
+        QA_MAX_QUEUE=str(args.max_queue),
+        QA_MAX_WAIT=str(args.max_wait),
+    )
+
+    from scripts import fake_medical_qa
+    fake_medical_qa.LLM_DELAY = args.llm_delay
+    fake_medical_qa.FAILURE_RATE = args.failure_rate
+    sys.modules["medical_qa"] = fake_medical_qa
+
+    import httpx
+    import main
+
+    # 일부 요청은 자동완성 추천 질문으로 보내 서버측 우선순위가 섞이게 한다
+    suggested = main.suggestion_index.top_queries(args.requests)
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=120) as client:
+        async def one(i: int):
+            await asyncio.sleep(args.spread * i / args.requests)
+            started = time.monotonic()
+            question = suggested[i % len(suggested)] if suggested and i % 3 == 0 else f"질문 {i}"
+            response = await client.post("/api/qa", json={"question": question})
+            if response.status_code == 200:
+                kind = "degraded" if response.json()["degraded"] else "full"
+            else:
+                kind = str(response.status_code)
+            return kind, time.monotonic() - started, response.headers.get("retry-after")
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(one(i) for i in range(args.requests)))
+        elapsed = time.monotonic() - started
+
+    latencies = defaultdict(list)
+    retry_after = Counter()
+    for kind, latency, header in results:
+        latencies[kind].append(latency)
+        if header:
+            retry_after[header] += 1
+
+    print(f"{args.requests} requests in {elapsed:.1f}s (llm_delay={args.llm_delay}s, "
+          f"failure_rate={args.failure_rate})")
+    for kind, values in sorted(latencies.items()):
+        values.sort()
+        print(f"  {kind:>8}: {len(values):4d}  p50={values[len(values) // 2]:.2f}s  max={values[-1]:.2f}s")
+    if retry_after:
+        print(f"  Retry-After: {dict(retry_after)}")
+    admission = main.admission
+    print(f"  final limit={admission.limit} in_flight={admission.in_flight} queued={admission.queued}")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
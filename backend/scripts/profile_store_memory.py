@@ -0,0 +1,111 @@
+"""ProfileStore 메모리/조회 속도 측정
+
+시트의 행을 반복해 N 개 프로필을 만들고(ID 와 긴 텍스트는 행마다 고유하게 변경)
+DataFrame, DoctorProfile 리스트, ProfileStore 의 메모리 사용량과 ID 조회 시간을 비교한다.
+
+사용 예:
+    python scripts/profile_store_memory.py
+    python scripts/profile_store_memory.py --profiles 50000
+"""
+import argparse
+import dataclasses
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+# backend 디렉토리를 Python path 에 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from app.core.data_processor import DoctorProfile
+from app.core.profile_store import CATEGORICAL_COLUMNS, ProfileStore
+
+MIB = 1024 * 1024
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare ProfileStore memory with DataFrame/DoctorProfile")
+    parser.add_argument("--profiles", type=int, default=10000, help="생성할 프로필 수")
+    parser.add_argument("--sheet", default=os.path.join(BACKEND_DIR, "Profile_refine_4_241217.xlsx"))
+    return parser.parse_args()
+
+
+def load_sheet(path: str) -> pd.DataFrame:
+    """main.py 와 같은 방식으로 시트 로드 및 전처리"""
+    df = pd.read_excel(path).replace("N/A", None)
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col].dtype):
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+        else:
+            df[col] = df[col].astype(object).fillna("N/A")
+    return df
+
+
+def scale(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """행을 반복해 n 개로 늘리고, 긴 텍스트는 행마다 고유한 문자열로 만든다"""
+    big = pd.concat([df] * (n // len(df) + 1), ignore_index=True).iloc[:n].copy()
+    big["ID"] = np.arange(n)
+    for col in big.columns:
+        if pd.api.types.is_numeric_dtype(big[col].dtype):
+            continue
+        if col in CATEGORICAL_COLUMNS:
+            big[col] = [str(value) for value in big[col]]
+        else:
+            big[col] = [f"{value}#{i}" for i, value in enumerate(big[col])]
+    return big
+
+
+def to_profiles(df: pd.DataFrame) -> list:
+    """DataProcessor.process_file 과 같은 필드 구성의 DoctorProfile 리스트"""
+    return [
+        DoctorProfile(
+            id=int(row["ID"]), hospital=str(row["Hospital"]), doctor_name=str(row["Doctor_Name"]),
+            department=str(row["Department"]), main_focus=str(row.get("Main", "N/A")),
+            specialty=str(row["Specialty"]), paper_count=int(row["Paper_Count"]),
+            education=str(row["Education_Parsed"]), experience=str(row["Experience_Parsed"]),
+            specialty_detail=str(row["specialty_detail"]), treatment_style=str(row["treatment_style"]),
+            uniqueness=str(row["uniqueness"]), patient_evaluation=str(row["patient_evaluation"]),
+            consultation_style=str(row["consultation_style"]), keywords=str(row["keywords"]),
+            total_posts=float(row["total_posts"]), total_comments=float(row["total_comments"]),
+            positive_ratio=float(row["positive_ratio"]), negative_ratio=float(row["negative_ratio"]),
+            neutral_ratio=float(row["neutral_ratio"]), avg_sentiment_score=float(row["avg_sentiment_score"]),
+            communication_score=float(row["communication_score"]),
+        )
+        for row in df.to_dict(orient="records")
+    ]
+
+
+def profiles_size(profiles: list) -> int:
+    """DoctorProfile 객체와 필드 값들의 메모리 합계 (bytes)"""
+    return sum(
+        sys.getsizeof(profile) + sum(sys.getsizeof(getattr(profile, f.name)) for f in dataclasses.fields(profile))
+        for profile in profiles
+    )
+
+
+def main(args):
+    df = scale(load_sheet(args.sheet), args.profiles)
+    profiles = to_profiles(df)
+    store_from_df = ProfileStore.from_dataframe(df)
+    store_from_profiles = ProfileStore.from_profiles(profiles)
+
+    print(f"Memory for {args.profiles} profiles:")
+    print(f"  DataFrame (deep)      {df.memory_usage(deep=True).sum() / MIB:8.1f} MiB")
+    print(f"  DoctorProfile list    {profiles_size(profiles) / MIB:8.1f} MiB")
+    print(f"  ProfileStore          {store_from_df.memory_usage() / MIB:8.1f} MiB "
+          f"({store_from_profiles.memory_usage() / MIB:.1f} MiB from DoctorProfile)")
+
+    target = args.profiles * 3 // 4
+    runs = 200
+    df_lookup = timeit.timeit(lambda: df.loc[df["ID"] == target].to_dict(orient="records"), number=runs)
+    store_lookup = timeit.timeit(lambda: store_from_df.get(target).to_dict(), number=runs)
+    print("ID lookup:")
+    print(f"  DataFrame mask        {df_lookup / runs * 1e6:8.1f} us")
+    print(f"  ProfileStore          {store_lookup / runs * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main(parse_args())
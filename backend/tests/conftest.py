@@ -0,0 +1,25 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# backend 디렉토리를 Python path 에 추가 (app.*, main, scripts.* import 용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def main_module(monkeypatch):
+    """가짜 LLM 을 붙인 main 모듈"""
+    for module in ("fastapi", "httpx", "openpyxl", "pinecone"):
+        pytest.importorskip(module)
+    from scripts import fake_medical_qa
+
+    monkeypatch.setitem(sys.modules, "medical_qa", fake_medical_qa)
+    monkeypatch.setattr(fake_medical_qa, "RETRIEVAL_DELAY", 0)
+    monkeypatch.setattr(fake_medical_qa, "LLM_DELAY", 0)
+    monkeypatch.setattr(fake_medical_qa, "FAILURE_RATE", 0.0)
+    sys.modules.pop("main", None)
+    module = importlib.import_module("main")
+    yield module
+    sys.modules.pop("main", None)
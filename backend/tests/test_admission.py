@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from app.core.admission import AdmissionController, OverloadedError
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_admits_up_to_limit_then_degrades_after_max_wait():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, max_queue=4, max_wait=0.05)
+        assert await controller.acquire() is True
+        # 슬롯이 반환되지 않으므로 대기 시간 초과 후 축소 모드
+        assert await controller.acquire() is False
+        assert controller.queued == 0
+        controller.release_degraded()
+        controller.release(0.1)
+        assert controller.in_flight == 0
+
+    run(scenario())
+
+
+def test_waiters_are_granted_in_priority_order():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, max_queue=4, max_wait=5)
+        assert await controller.acquire() is True
+
+        order = []
+
+        async def waiter(priority):
+            granted = await controller.acquire(priority)
+            order.append(priority)
+            return granted
+
+        tasks = [asyncio.create_task(waiter(p)) for p in (2, 0, 1)]
+        await asyncio.sleep(0)
+        assert controller.queued == 3
+
+        for _ in range(3):
+            controller.release(0.1)
+            await asyncio.sleep(0)
+        assert await asyncio.gather(*tasks) == [True, True, True]
+        assert order == [0, 1, 2]
+
+    run(scenario())
+
+
+def test_full_queue_evicts_lowest_priority_waiter():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, max_queue=2, max_wait=5)
+        assert await controller.acquire() is True
+
+        low = asyncio.create_task(controller.acquire(2))
+        mid = asyncio.create_task(controller.acquire(1))
+        await asyncio.sleep(0)
+
+        # 대기열이 가득 찬 상태에서 높은 우선순위 요청이 오면 priority=2 가 밀려난다
+        high = asyncio.create_task(controller.acquire(0))
+        await asyncio.sleep(0)
+        assert await low is False
+        assert controller.queued == 2
+
+        # 같은 우선순위끼리는 밀어내지 않고 바로 축소 모드
+        assert await controller.acquire(1) is False
+
+        controller.release(0.1)
+        assert await high is True
+        controller.release(0.1)
+        assert await mid is True
+
+    run(scenario())
+
+
+def test_rejects_with_retry_after_when_saturated():
+    async def scenario():
+        controller = AdmissionController(initial_limit=1, max_queue=0, max_degraded=1, target_latency=4)
+        assert await controller.acquire() is True
+        assert await controller.acquire() is False
+        with pytest.raises(OverloadedError) as excinfo:
+            await controller.acquire()
+        assert excinfo.value.retry_after >= 1
+
+    run(scenario())
+
+
+def test_limit_does_not_grow_below_saturation():
+    async def scenario():
+        controller = AdmissionController(initial_limit=4, max_limit=32, target_latency=1.0)
+        # 한 번에 하나씩만 실행되면 한도에 도달한 적이 없으므로 늘리지 않는다
+        for _ in range(600):
+            async with controller.admit() as full:
+                assert full is True
+        assert controller.limit == 4
+
+    run(scenario())
+
+
+def test_limit_increases_when_saturated_and_backs_off_on_slow_or_failed_calls():
+    async def scenario():
+        controller = AdmissionController(initial_limit=2, max_limit=16, target_latency=1.0)
+
+        for _ in range(12):
+            slots = controller.limit
+            for _ in range(slots):
+                assert await controller.acquire() is True
+            for _ in range(slots):
+                controller.release(0.1)
+        assert controller.limit > 2
+        raised = controller.limit
+
+        assert await controller.acquire() is True
+        controller.release(5.0)
+        assert controller.limit < raised
+
+        before_failure = controller.limit
+        with pytest.raises(RuntimeError):
+            async with controller.admit():
+                raise RuntimeError("LLM error")
+        assert controller.limit < before_failure
+        assert controller.in_flight == 0
+
+    run(scenario())
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"min_limit": 0},
+    {"min_limit": 4, "max_limit": 2},
+    {"initial_limit": 0},
+    {"initial_limit": 8, "max_limit": 4},
+    {"initial_limit": 2, "min_limit": 3},
+    {"max_queue": -1},
+    {"backoff": 1.5},
+])
+def test_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        AdmissionController(**kwargs)
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+
+def test_get_professor_by_id(main_module):
+    client = TestClient(main_module.app)
+    professor_id = next(iter(main_module.profile_store)).id
+    response = client.get(f"/api/professors/{professor_id}")
+    assert response.status_code == 200
+    assert response.json()["ID"] == professor_id
+
+
+def test_get_professor_by_unknown_id_returns_404(main_module):
+    client = TestClient(main_module.app)
+    response = client.get("/api/professors/99999")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "교수를 찾을 수 없습니다."
+
+
+def test_get_professors_filters_by_cancer_type(main_module):
+    client = TestClient(main_module.app)
+    everyone = client.get("/api/professors").json()
+    lung = client.get("/api/professors", params={"query": "폐암 명의"}).json()
+    assert len(everyone) == len(main_module.profile_store)
+    assert lung and len(lung) < len(everyone)
+    assert all(row["is_cancer_lung"] == 1 for row in lung)
@@ -0,0 +1,130 @@
+import logging
+import math
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from app.core.data_processor import DoctorProfile
+from app.core.profile_store import ProfileStore
+
+
+@pytest.fixture
+def frame():
+    """main.py 전처리를 거친 시트와 같은 형태의 작은 DataFrame"""
+    return pd.DataFrame({
+        "ID": [1030, 7, 250],
+        "Hospital": ["세브란스", "세브란스", "강남 성모병원"],
+        "Doctor_Name": ["김향선", "이수진", "박민호"],
+        "Department": ["심장혈관흉부외과", "영상의학과", "위장관외과"],
+        "Specialty": ["폐암", "흉부영상", "위암"],
+        "Paper_Count": [12, 300, 0],
+        "Education_Parsed": ["연세대 의대", "N/A", "가톨릭대 의대"],
+        "uniqueness": ["꼼꼼한 설명", "", "빠른 수술 일정"],
+        "positive_ratio": [0.5, 0.25, 0.0],
+        "is_cancer_lung": [1, 0, 0],
+        "is_cancer_stomach": [0, 0, 1],
+    }).astype({"Hospital": object, "Doctor_Name": object, "Department": object, "Specialty": object,
+               "Education_Parsed": object, "uniqueness": object})
+
+
+@pytest.fixture
+def store(frame):
+    return ProfileStore.from_dataframe(frame)
+
+
+def test_get_by_id_and_missing_id(store):
+    assert len(store) == 3
+    assert store.get(7)["Doctor_Name"] == "이수진"
+    assert store.get(250)["Hospital"] == "강남 성모병원"
+    assert store.get(99999) is None
+    assert 1030 in store and 99999 not in store
+
+
+def test_to_dict_matches_dataframe_records(frame, store):
+    records = frame.to_dict(orient="records")
+    assert [view.to_dict() for view in store] == records
+    assert list(store.get(1030).to_dict()) == list(frame.columns)
+
+
+def test_field_aliases_and_missing_alias(frame, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.core.profile_store"):
+        store = ProfileStore.from_dataframe(frame)
+    view = store.get(1030)
+    assert view.doctor_name == "김향선"
+    assert view.get("hospital") == "세브란스"
+    assert view.get("paper_count") == 12
+    assert view.get("education") == "연세대 의대"
+    # 이름이 같은 필드는 매핑 없이 그대로 조회
+    assert view.get("uniqueness") == "꼼꼼한 설명"
+
+    # 시트에 Main 컬럼이 없으면 경고 후 조회 불가
+    assert "'main_focus' has no source column" in caplog.text
+    assert view.get("main_focus") is None
+    assert view.get("main_focus", "N/A") == "N/A"
+    with pytest.raises(AttributeError):
+        view.main_focus
+
+
+def test_text_pool_round_trip(store):
+    assert [view["Education_Parsed"] for view in store] == ["연세대 의대", "N/A", "가톨릭대 의대"]
+    assert [view["uniqueness"] for view in store] == ["꼼꼼한 설명", "", "빠른 수술 일정"]
+    assert store._text_pool.count("꼼꼼한 설명") == 1
+
+
+def test_categorical_columns_are_interned(store):
+    vocabulary, codes = store._categorical["Hospital"]
+    assert vocabulary == ["세브란스", "강남 성모병원"]
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [0, 0, 1]
+
+
+def test_ints_are_narrowed_and_missing_floats_are_nan():
+    store = ProfileStore({
+        "ID": [1, 2, 70000],
+        "Paper_Count": [0, 300, 12],
+        "is_cancer_lung": [1, 0, 1],
+        "total_posts": [3.0, None, 1.5],
+    }, id_column="ID")
+    assert store._numeric["ID"].dtype == np.int32
+    assert store._numeric["Paper_Count"].dtype == np.int16
+    assert store._numeric["is_cancer_lung"].dtype == np.int8
+    assert store._numeric["total_posts"].dtype == np.float64
+    assert math.isnan(store._numeric["total_posts"][1])
+
+    assert store.get(2)["total_posts"] is None
+    assert store.get(70000)["total_posts"] == 1.5
+    assert isinstance(store.get(70000)["Paper_Count"], int)
+
+
+def test_from_dataframe_keeps_nan_floats_as_none():
+    frame = pd.DataFrame({"ID": [1, 2], "positive_ratio": [0.5, np.nan]})
+    store = ProfileStore.from_dataframe(frame)
+    assert store.get(1)["positive_ratio"] == 0.5
+    assert store.get(2)["positive_ratio"] is None
+
+
+def test_filter_any(store):
+    assert [view["ID"] for view in store.filter_any(["is_cancer_lung"])] == [1030]
+    assert [view["ID"] for view in store.filter_any(["is_cancer_lung", "is_cancer_stomach"])] == [1030, 250]
+    assert len(store.filter_any([])) == 3
+
+
+def test_from_profiles_uses_field_names():
+    profile = DoctorProfile(
+        id=1, hospital="세브란스", doctor_name="김향선", department="흉부외과", main_focus="폐암",
+        specialty="폐암 수술", paper_count=3, education="", experience="", specialty_detail="",
+        treatment_style="", uniqueness="", patient_evaluation="", consultation_style="", keywords="",
+    )
+    store = ProfileStore.from_profiles([profile])
+    view = store.get(1)
+    assert view.main_focus == "폐암"
+    assert view.total_posts is None
+
+
+def test_rejects_missing_or_non_numeric_id_column():
+    with pytest.raises(ValueError):
+        ProfileStore({"Doctor_Name": ["김향선"]}, id_column="ID")
+    with pytest.raises(ValueError):
+        ProfileStore({"ID": ["a"]}, id_column="ID")
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("openpyxl")
+pytest.importorskip("pinecone")
+
+from fastapi.testclient import TestClient
+
+from app.core.admission import AdmissionController
+from app.core.suggest import Suggestion, SuggestionIndex
+from scripts import fake_medical_qa
+
+
+def test_qa_returns_generated_answer(main_module):
+    client = TestClient(main_module.app)
+    response = client.post("/api/qa", json={"question": "폐암 명의"})
+    assert response.status_code == 200
+    assert response.json()["degraded"] is False
+
+
+def test_qa_returns_503_with_retry_after_when_saturated(main_module):
+    main_module.admission = AdmissionController(initial_limit=1, max_queue=0, max_degraded=0)
+    # 유일한 슬롯을 점유
+    assert asyncio.run(main_module.admission.acquire()) is True
+
+    client = TestClient(main_module.app)
+    response = client.post("/api/qa", json={"question": "폐암 명의"})
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_qa_failure_is_reported_to_controller_and_answered(main_module, monkeypatch):
+    monkeypatch.setattr(fake_medical_qa, "FAILURE_RATE", 1.0)
+    main_module.admission = AdmissionController(initial_limit=8)
+
+    client = TestClient(main_module.app)
+    response = client.post("/api/qa", json={"question": "폐암 명의"})
+    assert response.status_code == 200
+    assert "오류" in response.json()["answer"]
+    assert main_module.admission.limit < 8
+
+
+def test_qa_priority_is_decided_by_server(main_module, monkeypatch):
+    suggested = "폐암 잘 보는 교수님을 추천해주세요"
+    main_module.suggestion_index = SuggestionIndex([Suggestion("폐암", "specialty", suggested)], [["폐암"]])
+    assert main_module.qa_priority(suggested) == 0
+    assert main_module.qa_priority("폐암 명의") == 1
+
+    priorities = []
+    admit = main_module.admission.admit
+
+    def recording_admit(priority):
+        priorities.append(priority)
+        return admit(priority)
+
+    monkeypatch.setattr(main_module.admission, "admit", recording_admit)
+    client = TestClient(main_module.app)
+    # 클라이언트가 보낸 priority 는 무시된다
+    response = client.post("/api/qa", json={"question": "폐암 명의", "priority": 0})
+    assert response.status_code == 200
+    assert priorities == [1]
+
+
+def test_lifespan_cancels_precompute_task_on_shutdown(main_module, monkeypatch):
+    async def slow_precompute(*args, **kwargs):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(main_module.qa_system, "precompute_query_embeddings", slow_precompute)
+    with TestClient(main_module.app):
+        task = main_module.app.state.precompute_task
+        assert not task.done()
+    assert task.cancelled()
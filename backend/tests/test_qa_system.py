@@ -0,0 +1,37 @@
+import re
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("pinecone")
+
+from app.core.qa_system import QASystem
+
+# src/pages/ResultsPage.js 가 교수 리스트를 채울 때 사용하는 정규식
+RESULTS_PAGE_MAIN = re.compile(r"주요 진료분야\(Main\): ([^\n]+)")
+
+
+def degraded_answer(profiles):
+    qa = object.__new__(QASystem)
+    return qa._format_doctor_list(profiles)
+
+
+def test_degraded_answer_has_keyword_line_for_results_page():
+    answer = degraded_answer([
+        {"doctor_name": "김향선", "hospital": "세브란스", "department": "흉부외과",
+         "main_focus": "폐암", "specialty": "폐암 수술"},
+        {"doctor_name": "이수진", "hospital": "세브란스", "department": "종양내과",
+         "main_focus": "폐암", "specialty": "표적치료"},
+    ])
+    assert "1. **김향선** 교수님 (세브란스 흉부외과)" in answer
+    match = RESULTS_PAGE_MAIN.search(answer)
+    assert match.group(1) == "폐암"
+    assert "세부 전문분야(Specialty): 폐암 수술, 표적치료" in answer
+
+
+def test_degraded_answer_falls_back_to_specialty_without_main():
+    answer = degraded_answer([
+        {"doctor_name": "박민호", "hospital": "강남 성모병원", "department": "위장관외과",
+         "main_focus": None, "specialty": "위암"},
+    ])
+    assert RESULTS_PAGE_MAIN.search(answer).group(1) == "위암"
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("pinecone")
+np = pytest.importorskip("numpy")
+
+from app.core import search_engine
+from app.core.search_engine import SearchEngine
+
+
+class FakeIndex:
+    def query(self, **kwargs):
+        self.vector = kwargs["vector"]
+        return {"matches": [{"metadata": {"id": 1, "doctor_name": "김향선"}}]}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Pinecone/OpenAI 연결 없이 임베딩 호출만 기록하는 SearchEngine"""
+    engine = object.__new__(SearchEngine)
+    engine.index = FakeIndex()
+    engine.query_embeddings = {}
+    engine.suggested_queries = set()
+    engine.calls = []
+
+    async def get_embedding(text):
+        engine.calls.append(text)
+        return [0.5, 0.25, 0.125]
+
+    async def get_embeddings(texts):
+        engine.batches.append(list(texts))
+        return [[0.5, 0.25, 0.125] for _ in texts]
+
+    engine.batches = []
+    engine.get_embedding = get_embedding
+    engine.get_embeddings = get_embeddings
+    return engine
+
+
+def test_precomputed_query_skips_embedding_call(engine, tmp_path):
+    async def scenario():
+        await engine.precompute_query_embeddings(["폐암 잘 보는 교수님을 추천해주세요"],
+                                                 cache_file=str(tmp_path / "cache.pkl"))
+        assert engine.query_embeddings["폐암 잘 보는 교수님을 추천해주세요"].dtype == np.float32
+        engine.calls.clear()
+
+        results = await engine.search("폐암 잘 보는 교수님을 추천해주세요", top_k=3)
+        assert results[0]["doctor_name"] == "김향선"
+        assert engine.calls == []
+        assert engine.index.vector == [0.5, 0.25, 0.125]
+
+    asyncio.run(scenario())
+
+
+def test_suggested_query_is_memoized_on_first_use(engine, tmp_path):
+    async def scenario():
+        doctor_query = "김향선 교수님은 어떤 분이신가요?"
+        await engine.precompute_query_embeddings([], suggested_queries=[doctor_query],
+                                                 cache_file=str(tmp_path / "cache.pkl"))
+
+        await engine.search(doctor_query)
+        await engine.search(doctor_query)
+        assert engine.calls == [doctor_query]
+
+        # 추천 질문이 아닌 자유 질의는 보관하지 않는다
+        await engine.search("자유 질문")
+        await engine.search("자유 질문")
+        assert engine.calls.count("자유 질문") == 2
+
+    asyncio.run(scenario())
+
+
+def test_precompute_batches_missing_queries_and_reuses_cache(engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(search_engine, "EMBEDDING_BATCH_SIZE", 2)
+    cache_file = str(tmp_path / "cache.pkl")
+    queries = [f"질문 {i}" for i in range(5)]
+
+    async def scenario():
+        await engine.precompute_query_embeddings(queries, cache_file=cache_file)
+        assert engine.batches == [queries[0:2], queries[2:4], queries[4:5]]
+        assert engine.calls == []
+
+        # 캐시 파일에 있는 질문은 다시 계산하지 않는다
+        engine.query_embeddings.clear()
+        engine.batches.clear()
+        await engine.precompute_query_embeddings(queries + ["새 질문"], cache_file=cache_file)
+        assert engine.batches == [["새 질문"]]
+        assert set(engine.query_embeddings) == set(queries) | {"새 질문"}
+
+    asyncio.run(scenario())
+
+
+def test_failed_batch_is_skipped(engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(search_engine, "EMBEDDING_BATCH_SIZE", 2)
+
+    async def flaky(texts):
+        if "질문 0" in texts:
+            raise RuntimeError("rate limited")
+        return [[1.0] for _ in texts]
+
+    engine.get_embeddings = flaky
+    asyncio.run(engine.precompute_query_embeddings([f"질문 {i}" for i in range(4)],
+                                                   cache_file=str(tmp_path / "cache.pkl")))
+    assert set(engine.query_embeddings) == {"질문 2", "질문 3"}
+
+
+def test_get_embeddings_sends_one_request_in_input_order(engine):
+    class FakeEmbeddings:
+        def create(self, model, input):
+            self.inputs = input
+            data = [type("Item", (), {"index": i, "embedding": [float(i)]})() for i in range(len(input))]
+            return type("Response", (), {"data": list(reversed(data))})()
+
+    class FakeClient:
+        embeddings = FakeEmbeddings()
+
+    engine.openai_client = FakeClient()
+    del engine.get_embeddings
+    assert asyncio.run(engine.get_embeddings(["a", "b", "c"])) == [[0.0], [1.0], [2.0]]
+    assert FakeClient.embeddings.inputs == ["a", "b", "c"]
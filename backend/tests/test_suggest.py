@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from app.core.suggest import (
+    SuggestionIndex,
+    classify_keyword,
+    clean_term,
+    extract_keyword_terms,
+    is_fragment,
+    split_departments,
+)
+
+SHEET = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Profile_refine_4_241217.xlsx")
+
+# Profile_refine_4_241217.xlsx 의 keywords 컬럼 원문
+KEYWORDS_LUNG = (
+    "폐 결절 신속검사, 비소세포폐암, 돌연변이 유전자 검사(EGFR, ALK, ROS1, KRAS), 표적치료제, 면역항암제, "
+    "폐기능 검사(FVC), 호흡재활, NGS검사가 주요 키워드로 확인됩니다. 특히 신속한 진단과 치료, 정밀의료, "
+    "안전성이 강조되고 있습니다."
+)
+KEYWORDS_STAGING = (
+    "폐암, 편평상피세포암, T2aN1M0, PET CT, 협진, 수술 가능성 평가가 주요 키워드로 확인됩니다. "
+    "'세브란스'와 '흉부외과'는 전문 의료기관으로서의 신뢰도를 나타내는 핵심 키워드입니다."
+)
+KEYWORDS_REVIEW = (
+    "위암 수술, 복강경 수술, 로봇 수술이 가장 많이 언급되는 핵심 키워드입니다. 최소침습수술, 맞춤형 치료, "
+    "협진 시스템도 자주 등장하는 중요한 키워드입니다. 전문성, 풍부한 경험, 치료 성과 등이 긍정적인 맥락에서 "
+    "자주 언급됩니다."
+)
+
+
+def test_extract_keyword_terms_strips_particles_without_cutting_words():
+    terms = extract_keyword_terms(KEYWORDS_STAGING)
+    assert "편평상피세포암" in terms
+    assert "수술 가능성 평가" in terms
+    assert "수술 가능성 평" not in terms
+
+    terms = extract_keyword_terms(KEYWORDS_REVIEW)
+    assert "로봇 수술" in terms
+    assert "치료 성과" in terms
+    assert "치료 성" not in terms
+
+
+def test_extract_keyword_terms_rejects_unbalanced_parentheses():
+    terms = extract_keyword_terms(KEYWORDS_LUNG)
+    assert "표적치료제" in terms
+    assert "폐기능 검사(FVC)" in terms
+    assert "NGS검사" in terms
+    assert not any(term.count("(") != term.count(")") for term in terms)
+
+
+def test_extract_keyword_terms_rejects_particles_and_titles():
+    terms = extract_keyword_terms(
+        "점도, 이들, 환자들의, 유전자 치료도, 수술 잘하는, 서울대병원장, 위암센터장, 폐암 전문의, "
+        "간내담도, 정확도, 결핵 흔적이 주요 키워드입니다."
+    )
+    assert terms == ["간내담도", "정확도", "결핵 흔적"]
+
+
+@pytest.mark.parametrize("term", ["점도", "용어도", "자원봉사도", "이들", "표현들", "환자들의", "치료의",
+                                  "수술 잘하는", "신중한", "전문적인", "원장", "국립암센터 원장",
+                                  "암센터장", "국제위암학회 사무총장", "식도암 전문의", "전문의"])
+def test_is_fragment(term):
+    assert is_fragment(term)
+
+
+@pytest.mark.parametrize("term", ["간내담도", "종양 분화도", "식도", "강의", "성인심장", "생존기간 연장",
+                                  "가족간병인", "치료 효과", "폐암"])
+def test_is_not_fragment(term):
+    assert not is_fragment(term)
+
+
+def test_split_departments_unwraps_list_literals():
+    assert split_departments("[심장혈관흉부외과, 폐암센터 심장혈관흉부외과]") == [
+        "심장혈관흉부외과", "폐암센터 심장혈관흉부외과",
+    ]
+    assert split_departments("[영상의학과]") == ["영상의학과"]
+    assert split_departments("[위장관외과, 위암센터 외과, 소화기내시경센터(]") == ["위장관외과", "위암센터 외과"]
+    assert clean_term("[대장항문외과] 대장암") == "대장암"
+
+
+def test_classify_keyword():
+    assert classify_keyword("항암치료") == "keyword"
+    assert classify_keyword("친절함") == "attribute"
+    assert classify_keyword("전문성") == "attribute"
+    assert classify_keyword("예약 어려움") == "negative"
+    assert classify_keyword("설명 부족") == "negative"
+    assert classify_keyword("헌신적") == "attribute"
+    assert classify_keyword("결핵 흔적") == "keyword"
+    assert classify_keyword("권위적") == "negative"
+
+
+@pytest.fixture(scope="module")
+def index():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("openpyxl")
+    from app.core.profile_store import ProfileStore
+
+    df = pd.read_excel(SHEET)
+    return SuggestionIndex.from_profiles(ProfileStore.from_dataframe(df))
+
+
+def test_suggestions_from_sheet_are_well_formed(index):
+    for suggestion in index.suggestions:
+        assert "[" not in suggestion.label and "]" not in suggestion.label
+        assert suggestion.label.count("(") == suggestion.label.count(")")
+        assert "잘 보는" not in suggestion.query or suggestion.kind in ("specialty", "keyword")
+        for word in ("부족", "어려움"):
+            assert word not in suggestion.query
+        assert "잘 보는 잘" not in suggestion.query and "하는 잘 보는" not in suggestion.query
+
+
+def test_keyword_suggestions_from_sheet_exclude_fragments_and_hospitals(index):
+    keywords = {s.label for s in index.suggestions if s.kind == "keyword"}
+    for junk in ("환자들의", "이들", "점도", "용어도", "자원봉사도", "원장", "서울대병원장", "메이저 병원",
+                 "수술 잘하는", "서울성모병원", "세브란스", "폐암 전문의"):
+        assert junk not in keywords
+    assert not any(is_fragment(label) for label in keywords)
+    assert not any(label.endswith("병원") for label in keywords)
+    assert {"간내담도", "결핵 흔적"} <= keywords
+
+
+def test_suggest_on_sheet(index):
+    labels = [s.label for s in index.suggest("폐", 5)]
+    assert labels[0] == "폐암"
+
+    hospitals = [s.label for s in index.suggest("성모", 5) if s.kind == "hospital"]
+    assert "강남 성모병원" in hospitals
+
+    departments = [s.query for s in index.suggest("영상의학", 5) if s.kind == "department"]
+    assert departments[0] == "영상의학과 교수님을 추천해주세요"
+
+    attribute = next(s for s in index.suggest("친절함", 5) if s.label == "친절함")
+    assert attribute.kind == "attribute"
+    assert attribute.query == "친절함으로 평가받는 교수님을 추천해주세요"
+
+    assert index.suggest("김향선")[0].kind == "doctor"
+    assert index.suggest("xyz") == []
+
+
+def test_top_queries_reserves_budget_for_doctors(index):
+    queries = index.top_queries(200)
+    assert len(queries) == 200
+    doctor_queries = {s.query for s in index.suggestions if s.kind == "doctor"}
+    attribute_queries = {s.query for s in index.suggestions if s.kind == "attribute"}
+    assert sum(query in doctor_queries for query in queries) == 50
+    assert not attribute_queries & set(queries)
+    assert set(queries) <= set(index.queries())
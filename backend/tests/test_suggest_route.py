@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+
+def test_suggest_route_uses_preprocessed_sheet(main_module):
+    # main.py 전처리 후에도 문자열 컬럼이 유지되어야 한다 (숫자 0 으로 바뀌면 인덱스가 비어 있음)
+    doctor_name = next(iter(main_module.profile_store))["Doctor_Name"]
+    assert isinstance(doctor_name, str) and doctor_name != "N/A"
+    assert len(main_module.suggestion_index.suggestions) > 1000
+
+    client = TestClient(main_module.app)
+    response = client.get("/api/suggest", params={"prefix": "폐", "limit": 5})
+    assert response.status_code == 200
+    suggestions = response.json()
+    assert len(suggestions) == 5
+    assert suggestions[0] == {"label": "폐암", "kind": "specialty", "query": "폐암 잘 보는 교수님을 추천해주세요"}
+
+
+def test_suggest_route_finds_doctor_and_validates_params(main_module):
+    client = TestClient(main_module.app)
+    doctors = [s for s in client.get("/api/suggest", params={"prefix": "김향선"}).json() if s["kind"] == "doctor"]
+    assert doctors and doctors[0]["query"] == "김향선 교수님은 어떤 분이신가요?"
+
+    assert client.get("/api/suggest", params={"prefix": "xyz"}).json() == []
+    assert client.get("/api/suggest", params={"prefix": ""}).status_code == 422
+    assert client.get("/api/suggest", params={"prefix": "폐", "limit": 50}).status_code == 422
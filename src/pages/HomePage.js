@@ -1,23 +1,51 @@
-import React, { useState } from "react";
+import React, { useEffect, useState } from "react";
 
+import axios from "axios";
 import { useNavigate } from "react-router-dom";
 
 function HomePage() {
   const [query, setQuery] = useState("");
+  const [suggestions, setSuggestions] = useState([]);
   const navigate = useNavigate();
 
+  // 자동완성 추천 (입력이 멈춘 뒤 150ms 후 요청, 이전 입력의 요청은 취소)
+  useEffect(() => {
+    if (!query.trim()) {
+      setSuggestions([]);
+      return;
+    }
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get("http://localhost:8000/api/suggest", {
+          params: { prefix: query, limit: 8 },
+          signal: controller.signal
+        });
+        setSuggestions(response.data);
+      } catch (error) {
+        if (axios.isCancel(error)) return;
+        console.error("Error fetching suggestions:", error);
+        setSuggestions([]);
+      }
+    }, 150);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [query]);
+
   // HomePage.js 수정
-  const handleSearch = () => {
-    if (query.trim()) {
+  const handleSearch = (text = query) => {
+    if (text.trim()) {
       // 쿼리를 URL 파라미터로 전달
-      navigate(`/search-results?query=${encodeURIComponent(query)}`);
+      navigate(`/search-results?query=${encodeURIComponent(text)}`);
     }
   };
 
   return (
     <div className="flex flex-col items-center justify-center h-screen bg-gray-100">
       <h1 className="text-6xl font-bold text-blue-500 mb-8">Dr.WHO</h1>
-      <div className="flex w-1/2">
+      <div className="relative flex w-1/2">
         <input
           type="text"
           placeholder="병명이나 교수에 대해 질문해주세요"
@@ -27,11 +55,26 @@ function HomePage() {
           onKeyPress={(e) => e.key === "Enter" && handleSearch()}
         />
         <button
-          onClick={handleSearch}
+          onClick={() => handleSearch()}
           className="bg-blue-500 text-white p-4 rounded-r-lg hover:bg-blue-600"
         >
           검색
         </button>
+
+        {/* 추천 질문을 선택하면 서버에 미리 계산된 임베딩이 그대로 사용됨 */}
+        {suggestions.length > 0 && (
+          <ul className="absolute top-full left-0 w-full bg-white border border-gray-300 rounded-b-lg shadow z-10">
+            {suggestions.map((suggestion, index) => (
+              <li
+                key={`${suggestion.query}-${index}`}
+                onClick={() => handleSearch(suggestion.query)}
+                className="p-3 cursor-pointer hover:bg-gray-100"
+              >
+                {suggestion.label}
+              </li>
+            ))}
+          </ul>
+        )}
       </div>
     </div>
   );